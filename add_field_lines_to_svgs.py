@@ -1,3 +1,4 @@
+import json
 import os
 import xml.etree.ElementTree as ET
 
@@ -12,6 +13,68 @@ LINE_X2 = str(750 - LABEL_X)
 LINE_COLOR = '#e0e0e0'
 LINE_WIDTH = '2'
 Y_OFFSET = 4 # px below last value line
+LAYOUT_INDEX_FILENAME = 'layout_index.json'
+
+
+def load_layout_index(cards_dir='cards'):
+    """
+    Load the layout index written by generate_power_cards: the card geometry
+    and the layout records keyed by card file stem. Returns None if the cards
+    predate the index.
+    """
+    path = os.path.join(cards_dir, LAYOUT_INDEX_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def line_extent(index):
+    """
+    (x1, x2) of the underlines for the cards in a layout index: the body
+    width, starting at the label column. Profile canvases wider than the
+    design size shift the body right.
+    """
+    x1 = index['label_x']
+    return str(x1), str(x1 + int(LINE_X2) - int(LINE_X1))
+
+
+def underline_positions(layout, fields_to_underline=FIELDS_TO_UNDERLINE):
+    """
+    Compute the underline y positions for a card from its layout record.
+    Each underlined field gets a line below the last value line before the
+    next underlined field; the last underlined field gets none.
+    """
+    fields = layout['fields']
+    starts = [i for i, field in enumerate(fields) if field['label'] in fields_to_underline]
+    positions = []
+    for n, start in enumerate(starts[:-1]):
+        value_ys = [y for field in fields[start:starts[n+1]] for y in field['value_ys']]
+        if value_ys:
+            positions.append(float(max(value_ys)) + Y_OFFSET)
+        else:
+            # If no value lines, put line below label
+            positions.append(float(fields[start]['label_y']) + 32)
+    return positions
+
+
+def add_lines_from_layout(svg_path, layout, fields_to_underline=FIELDS_TO_UNDERLINE, extent=(LINE_X1, LINE_X2)):
+    """
+    Append the underlines straight from the layout record, splicing them in
+    before the closing </svg> tag instead of parsing the document.
+    """
+    x1, x2 = extent
+    lines = ''.join(
+        f'<line x1="{x1}" x2="{x2}" y1="{line_y}" y2="{line_y}" '
+        f'stroke="{LINE_COLOR}" stroke-width="{LINE_WIDTH}" />'
+        for line_y in underline_positions(layout, fields_to_underline)
+    )
+    with open(svg_path, encoding='utf-8') as f:
+        svg = f.read()
+    end = svg.rindex('</svg>')
+    # Unix line endings on every platform, as generate_power_cards.save_svg writes
+    with open(svg_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(svg[:end] + lines + svg[end:])
 
 
 def add_lines_to_svg(svg_path, fields_to_underline=FIELDS_TO_UNDERLINE):
@@ -55,19 +118,24 @@ def add_lines_to_svg(svg_path, fields_to_underline=FIELDS_TO_UNDERLINE):
         })
         root.append(line)
 
-    tree.write(svg_path, encoding='utf-8', xml_declaration=True)
+    # Binary file, so no line ending translation on Windows
+    with open(svg_path, 'wb') as f:
+        tree.write(f, encoding='utf-8', xml_declaration=True)
 
 
-def print_label_distances(svg_path, field_labels=FIELDS_TO_UNDERLINE):
-    tree = ET.parse(svg_path)
-    root = tree.getroot()
-    ns = {'svg': SVG_NS}
-    texts = root.findall('.//svg:text', ns)
-    label_ys = []
-    for t in texts:
-        txt = (t.text or '').strip(':')
-        if txt in field_labels and t.attrib.get('x') == str(LABEL_X):
-            label_ys.append(float(t.attrib['y']))
+def print_label_distances(svg_path, field_labels=FIELDS_TO_UNDERLINE, layout=None):
+    if layout is not None:
+        label_ys = [float(field['label_y']) for field in layout['fields'] if field['label'] in field_labels]
+    else:
+        tree = ET.parse(svg_path)
+        root = tree.getroot()
+        ns = {'svg': SVG_NS}
+        texts = root.findall('.//svg:text', ns)
+        label_ys = []
+        for t in texts:
+            txt = (t.text or '').strip(':')
+            if txt in field_labels and t.attrib.get('x') == str(LABEL_X):
+                label_ys.append(float(t.attrib['y']))
     label_ys.sort()
     distances = [label_ys[i+1] - label_ys[i] for i in range(len(label_ys)-1)]
     print(f'  Label y-positions: {label_ys}')
@@ -75,12 +143,20 @@ def print_label_distances(svg_path, field_labels=FIELDS_TO_UNDERLINE):
 
 
 def process_all_svgs(cards_dir='cards'):
+    index = load_layout_index(cards_dir)
+    layouts = index['cards'] if index else {}
+    extent = line_extent(index) if index else (LINE_X1, LINE_X2)
     for fname in os.listdir(cards_dir):
         if fname.lower().endswith('.svg'):
             svg_path = os.path.join(cards_dir, fname)
             print(f'Processing {svg_path}...')
-            add_lines_to_svg(svg_path)
-            print_label_distances(svg_path)
+            layout = layouts.get(os.path.splitext(fname)[0])
+            if layout is not None:
+                add_lines_from_layout(svg_path, layout, extent=extent)
+            else:
+                # Cards generated before the layout index existed
+                add_lines_to_svg(svg_path)
+            print_label_distances(svg_path, layout=layout)
 
 if __name__ == '__main__':
     process_all_svgs() 
\ No newline at end of file
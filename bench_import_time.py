@@ -0,0 +1,97 @@
+"""
+Import-time benchmark for the mmrpg_cards CLI.
+
+Runs each invocation under `python -X importtime`, subtracts the imports a bare
+interpreter already pays for, and checks the result against a target. Also
+fails if an invocation pulls in a heavy dependency it should not need.
+
+    python bench_import_time.py [--target-ms N] [--repeat N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+CLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mmrpg_cards.py')
+
+# Added import time allowed for help and no-op invocations
+DEFAULT_TARGET_MS = 30
+
+HEAVY_MODULES = ('svgwrite', 'PIL', 'bs4', 'numpy')
+
+# (label, CLI arguments, held to the import-time target). None of these may
+# import a heavy module.
+CASES = [
+    ('no-op', [], True),
+    ('help', ['--help'], True),
+    ('render --help', ['render', '--help'], True),
+    ('check', ['check'], False),
+]
+
+
+def run_importtime(args):
+    """
+    Run the interpreter with -X importtime and return (module, cumulative_us,
+    nested) for every import it reports.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        cwd=os.path.dirname(CLI),
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((name.strip(), int(cumulative), name.startswith('  ')))
+    return imports
+
+
+def measure(args, repeat):
+    """
+    Best-of-N import time in ms on top of a bare interpreter, and the set of
+    top-level packages imported.
+    """
+    best = None
+    for _ in range(repeat):
+        baseline = {name for name, _, _ in run_importtime(['-c', 'pass'])}
+        imports = run_importtime([CLI] + args)
+        # Nested imports are already counted in their parent's cumulative time
+        added = sum(us for name, us, nested in imports if not nested and name not in baseline) / 1000
+        best = added if best is None else min(best, added)
+    packages = {name.split('.')[0] for name, _, _ in imports}
+    return best, packages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check mmrpg_cards CLI import time.')
+    parser.add_argument('--target-ms', type=float, default=DEFAULT_TARGET_MS, help=f'allowed added import time in ms (default: {DEFAULT_TARGET_MS})')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per invocation; the best is kept (default: 5)')
+    args = parser.parse_args(argv)
+    target_ms = args.target_ms
+    repeat = args.repeat
+
+    failures = 0
+    print(f"{'Invocation':<16} {'Imports':>10}  Heavy modules")
+    for label, args, gated in CASES:
+        ms, packages = measure(args, repeat)
+        heavy = sorted(packages.intersection(HEAVY_MODULES))
+        status = ''
+        if heavy:
+            status = 'FAIL (imports ' + ', '.join(heavy) + ')'
+            failures += 1
+        elif gated and ms > target_ms:
+            status = f'FAIL (over {target_ms:g} ms target)'
+            failures += 1
+        print(f"{label:<16} {ms:>7.1f} ms  {', '.join(heavy) or '-'}  {status}")
+
+    if failures:
+        print(f"\n❌ {failures} invocation(s) missed the import-time target")
+        return 1
+    print(f"\n✅ Help and no-op invocations import in under {target_ms:g} ms and skip heavy dependencies")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import argparse
+import math
+
+# Card sizes we print, in inches (width, height)
+CARD_SIZES = {
+    'poker': (2.5, 3.5),
+    'bridge': (2.25, 3.5),
+    'tarot': (2.75, 4.75),
+    'mini': (1.75, 2.5),
+}
+DPIS = (300, 600)
+
+# Named output profiles, e.g. 'poker_300' or 'bridge_600'
+PROFILES = {}
+for _size, (_width_in, _height_in) in CARD_SIZES.items():
+    for _dpi in DPIS:
+        PROFILES[f'{_size}_{_dpi}'] = {
+            'name': f'{_size}_{_dpi}',
+            'width_in': _width_in,
+            'height_in': _height_in,
+            'dpi': _dpi,
+            'width_px': round(_width_in * _dpi),
+            'height_px': round(_height_in * _dpi),
+        }
+
+# What print_ready/ and the sheet builder have always used (675x1050px)
+DEFAULT_PROFILE = 'bridge_300'
+
+# Print sheet: 8.5" x 11" paper in landscape orientation
+SHEET_WIDTH_IN = 11
+SHEET_HEIGHT_IN = 8.5
+
+
+def get_profile(name):
+    """
+    Look up a profile by name, raising ValueError with the valid names if it
+    does not exist.
+    """
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown card profile '{name}' (choose from {', '.join(PROFILES)})") from None
+
+
+def parse_profiles(spec):
+    """
+    Parse a comma-separated profile list ('poker_300,bridge_600' or 'all').
+    Used as an argparse type, so an unknown name raises ArgumentTypeError and
+    becomes a usage error.
+    """
+    if spec == 'all':
+        return list(PROFILES.values())
+    try:
+        return [get_profile(name.strip()) for name in spec.split(',') if name.strip()]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def sheet_grid(profile):
+    """
+    Grid geometry for laying out cards of the given profile on a print sheet:
+    as many columns and rows as fit, centered on the page. cards_per_sheet is
+    the number of cards every sheet builder puts on one sheet.
+    """
+    dpi = profile['dpi']
+    sheet_width = int(SHEET_WIDTH_IN * dpi)
+    sheet_height = int(SHEET_HEIGHT_IN * dpi)
+    card_width = profile['width_px']
+    card_height = profile['height_px']
+    cols = sheet_width // card_width
+    rows = sheet_height // card_height
+    return {
+        'sheet_width': sheet_width,
+        'sheet_height': sheet_height,
+        'card_width': card_width,
+        'card_height': card_height,
+        'cols': cols,
+        'rows': rows,
+        'cards_per_sheet': cols * rows,
+        'margin_x': (sheet_width - cols * card_width) // 2,
+        'margin_y': (sheet_height - rows * card_height) // 2,
+    }
@@ -0,0 +1,284 @@
+"""
+Golden-hash regression check for the card pipeline.
+
+Hashes three things and compares them with golden_hashes.json:
+
+- layouts: the layout record of every power in marvel_powers.json
+- cards:   the SVG bytes draw_card writes for every power
+- sheets:  the decoded pixels and DPI of a sample of print sheets, built from
+           synthetic card PNGs with every compositing backend
+
+Sheets are compared by pixels rather than file bytes so the check does not
+depend on the zlib build. Every backend must match the same golden hash.
+
+It also runs pipeline.build on a few powers, with a stand-in rasterizer that
+copies synthetic PNGs, and checks its card SVGs and sheets match the staged
+render and sheet builders, and checks that the layout fit's line counting
+agrees with textwrap.wrap.
+
+    python check_golden_hashes.py            # verify
+    python check_golden_hashes.py --update   # rewrite golden_hashes.json
+"""
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_FILE = os.path.join(HERE, 'golden_hashes.json')
+POWERS_FILE = os.path.join(HERE, 'marvel_powers.json')
+
+# Sample sheets: profile, number of synthetic cards. Covers full and partial
+# sheets for the 4x2 bridge grid and the 6x3 mini grid
+SHEET_SAMPLES = [
+    ('bridge_300', 11),
+    ('mini_300', 20),
+]
+
+# Pipeline-vs-staged samples: profile and number of powers. Each is a full and
+# a partial sheet: 6x3 mini cards, and 4x1 tarot cards on a canvas taller
+# than the design
+PIPELINE_SAMPLES = [
+    ('mini_300', 20),
+    ('tarot_300', 5),
+]
+
+# Stand-in for ImageMagick: copy the synthetic PNG with the same file name
+COPY_RASTERIZER = [
+    sys.executable, '-c',
+    'import os, shutil, sys; shutil.copy(os.path.join(sys.argv[1], os.path.basename(sys.argv[2])), sys.argv[2])',
+]
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def layout_hashes(powers):
+    from generate_power_cards import layout_card, sanitize_filename
+    return {
+        sanitize_filename(power.get('power', 'Unknown Power')): _sha256(json.dumps(layout_card(power), sort_keys=True).encode('utf-8'))
+        for power in powers
+    }
+
+
+def card_hashes(powers, workdir):
+    from generate_power_cards import draw_card
+    outdir = os.path.join(workdir, 'cards')
+    hashes = {}
+    for power in powers:
+        layout = draw_card(power, outdir=outdir)
+        with open(os.path.join(outdir, layout['filename']), 'rb') as f:
+            hashes[os.path.splitext(layout['filename'])[0]] = _sha256(f.read())
+    return hashes
+
+
+def write_sample_cards(outdir, profile, stems):
+    """
+    Write a deterministic card PNG at the profile size for each file stem: a
+    colored field with a block whose position and color depend on the card
+    number.
+    """
+    from PIL import Image, ImageDraw
+    os.makedirs(outdir, exist_ok=True)
+    width, height = profile['width_px'], profile['height_px']
+    for i, stem in enumerate(stems):
+        card = Image.new('RGB', (width, height), ((37 * i) % 256, (91 * i) % 256, (151 * i) % 256))
+        draw = ImageDraw.Draw(card)
+        x = (i * 29) % (width // 2)
+        y = (i * 53) % (height // 2)
+        draw.rectangle([(x, y), (x + width // 3, y + height // 4)], fill=((200 + i) % 256, 40, (13 * i) % 256))
+        card.save(os.path.join(outdir, stem + '.png'))
+
+
+def sheet_digest(path):
+    from PIL import Image
+    with Image.open(path) as sheet:
+        header = f"{sheet.mode} {sheet.size} {sheet.info.get('dpi')}".encode('utf-8')
+        return _sha256(header + sheet.tobytes())
+
+
+def sheet_hashes(workdir):
+    from card_profiles import get_profile
+    from create_printable_sheets import SHEET_BACKENDS, create_card_sheets, create_sheets_with_cut_lines
+    hashes = {}
+    for profile_name, count in SHEET_SAMPLES:
+        input_dir = os.path.join(workdir, 'sample_cards', profile_name)
+        write_sample_cards(input_dir, get_profile(profile_name), [f'card_{i:03d}' for i in range(count)])
+        for backend in SHEET_BACKENDS:
+            output_dir = os.path.join(workdir, 'sheets', profile_name, backend)
+            with contextlib.redirect_stdout(io.StringIO()):
+                create_card_sheets(input_dir, output_dir, profile=profile_name, backend=backend)
+                create_sheets_with_cut_lines(input_dir, output_dir, profile=profile_name, backend=backend)
+            for fname in sorted(os.listdir(output_dir)):
+                key = f'{profile_name}/{fname}'
+                hashes.setdefault(key, {})[backend] = sheet_digest(os.path.join(output_dir, fname))
+    return hashes
+
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return _sha256(f.read())
+
+
+def pipeline_mismatches(powers, workdir):
+    """
+    Build the first few powers of each PIPELINE_SAMPLES profile with
+    pipeline.build and with the staged steps: draw_card and
+    write_layout_index for the profile, then the sheet builders on the same
+    card PNGs. Returns a list of files that differ.
+    """
+    from card_profiles import get_profile
+    from create_printable_sheets import create_card_sheets, create_sheets_with_cut_lines
+    from generate_power_cards import draw_card, sanitize_filename, write_layout_index
+    from pipeline import build
+    problems = []
+    for profile_name, count in PIPELINE_SAMPLES:
+        profile = get_profile(profile_name)
+        root = os.path.join(workdir, 'pipeline', profile_name)
+        source_dir = os.path.join(root, 'source')
+        powers_path = os.path.join(root, 'powers.json')
+        os.makedirs(root)
+        with open(powers_path, 'w', encoding='utf-8') as f:
+            json.dump(powers[:count], f)
+        write_sample_cards(source_dir, profile, [sanitize_filename(power.get('power', 'Unknown Power')) for power in powers[:count]])
+
+        dirs = {name: os.path.join(root, name) for name in ('cards', 'png', 'sheets', 'guides', 'staged_cards', 'staged_sheets', 'staged_guides')}
+        with contextlib.redirect_stdout(io.StringIO()):
+            failed = build(powers_path, profile=profile_name, workers=2, cards_dir=dirs['cards'], png_dir=dirs['png'],
+                           sheets_dir=dirs['sheets'], guides_dir=dirs['guides'], rasterize_command=COPY_RASTERIZER + [source_dir, '{png}'])
+            if failed:
+                problems.append(f'pipeline: build failed for {profile_name}')
+                continue
+            layouts = [draw_card(power, outdir=dirs['staged_cards'], profiles=[profile]) for power in powers[:count]]
+            write_layout_index(sorted(layouts, key=lambda layout: layout['filename']), os.path.join(dirs['staged_cards'], profile_name), profile=profile)
+            create_card_sheets(dirs['png'], dirs['staged_sheets'], profile=profile_name)
+            create_sheets_with_cut_lines(dirs['png'], dirs['staged_guides'], profile=profile_name)
+
+        for kind, digest in (('cards', _file_digest), ('sheets', sheet_digest), ('guides', sheet_digest)):
+            built_dir = os.path.join(dirs[kind], profile_name) if kind == 'cards' else dirs[kind]
+            staged_dir = os.path.join(dirs['staged_' + kind], profile_name) if kind == 'cards' else dirs['staged_' + kind]
+            built = sorted(os.listdir(built_dir))
+            staged = sorted(os.listdir(staged_dir))
+            if built != staged:
+                problems.append(f'pipeline: {profile_name} {kind} {built} != staged {staged}')
+                continue
+            for fname in built:
+                if digest(os.path.join(built_dir, fname)) != digest(os.path.join(staged_dir, fname)):
+                    problems.append(f'pipeline: {profile_name}/{fname} differs from the staged build')
+    return problems
+
+
+def wrap_mismatches(powers):
+    """
+    Compare count_wrapped_lines with len(wrap_text_pixel()) for every quote
+    and field of every power, at every font size and width the layout fit
+    uses. Returns a list of the texts where they differ.
+    """
+    import generate_power_cards as cards
+    fonts = range(min(cards.MIN_DESC_FONT_SIZE, cards.MIN_VALUE_FONT_SIZE), max(cards.DESC_FONT_SIZE, cards.VALUE_FONT_SIZE) + 1)
+    widths = (cards.BODY_WIDTH, cards.BODY_WIDTH - 20, cards.BODY_WIDTH - 210)
+    texts = sorted({str(power[key]) for power in powers for key in ['quote'] + cards.FIELD_ORDER if power.get(key)})
+    problems = []
+    for text in texts:
+        for font in fonts:
+            for width in widths:
+                if cards.count_wrapped_lines(text, font, width) != len(cards.wrap_text_pixel(text, font, width)):
+                    problems.append(f'wrap: {text[:40]!r} at {font}pt over {width}px')
+    return problems
+
+
+def compute_hashes(powers_path=POWERS_FILE):
+    with open(powers_path, encoding='utf-8') as f:
+        powers = json.load(f)
+    with tempfile.TemporaryDirectory() as workdir:
+        return {
+            'layouts': layout_hashes(powers),
+            'cards': card_hashes(powers, workdir),
+            'sheets': sheet_hashes(workdir),
+            'pipeline': pipeline_mismatches(powers, workdir),
+            'wrap': wrap_mismatches(powers),
+        }
+
+
+def compare(golden, current):
+    """
+    Return a list of human-readable mismatches between two hash sets.
+    """
+    problems = []
+    for section in ('layouts', 'cards'):
+        expected = golden.get(section, {})
+        actual = current[section]
+        for key in sorted(expected.keys() | actual.keys()):
+            if key not in actual:
+                problems.append(f'{section}: {key} missing')
+            elif key not in expected:
+                problems.append(f'{section}: {key} has no golden hash')
+            elif expected[key] != actual[key]:
+                problems.append(f'{section}: {key} changed')
+    expected = golden.get('sheets', {})
+    for key in sorted(expected.keys() | current['sheets'].keys()):
+        if key not in current['sheets']:
+            problems.append(f'sheets: {key} missing')
+        elif key not in expected:
+            problems.append(f'sheets: {key} has no golden hash')
+        else:
+            for backend, digest in sorted(current['sheets'][key].items()):
+                if digest != expected[key]:
+                    problems.append(f'sheets: {key} changed ({backend} backend)')
+    return problems
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    current = compute_hashes()
+
+    # Backends must agree with each other before anything is compared or saved
+    disagreeing = [key for key, digests in current['sheets'].items() if len(set(digests.values())) > 1]
+    if disagreeing:
+        print(f"❌ Sheet backends disagree on {len(disagreeing)} sheets:")
+        for key in sorted(disagreeing):
+            print(f"   {key}")
+        return 1
+    # The pipeline must agree with the staged build, and the line counter with
+    # textwrap, regardless of the golden file
+    if current['pipeline']:
+        print("❌ Pipeline output differs from the staged build:")
+        for problem in current['pipeline']:
+            print(f"   {problem}")
+        return 1
+    if current['wrap']:
+        print(f"❌ count_wrapped_lines disagrees with textwrap.wrap for {len(current['wrap'])} texts:")
+        for problem in current['wrap'][:20]:
+            print(f"   {problem}")
+        return 1
+
+    if '--update' in argv:
+        golden = {
+            'layouts': current['layouts'],
+            'cards': current['cards'],
+            'sheets': {key: next(iter(digests.values())) for key, digests in current['sheets'].items()},
+        }
+        with open(GOLDEN_FILE, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(golden, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"💾 Wrote {len(golden['layouts'])} layout, {len(golden['cards'])} card and {len(golden['sheets'])} sheet hashes to {os.path.basename(GOLDEN_FILE)}")
+        return 0
+
+    with open(GOLDEN_FILE, encoding='utf-8') as f:
+        golden = json.load(f)
+    problems = compare(golden, current)
+    if problems:
+        print(f"❌ {len(problems)} outputs differ from {os.path.basename(GOLDEN_FILE)}:")
+        for problem in problems:
+            print(f"   {problem}")
+        return 1
+    print(f"✅ {len(current['layouts'])} layouts, {len(current['cards'])} cards and {len(current['sheets'])} sheets match {os.path.basename(GOLDEN_FILE)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,68 +1,204 @@
-from PIL import Image
 import os
+import sys
 import math
+from card_profiles import DEFAULT_PROFILE, get_profile, sheet_grid
 
-def create_card_sheets(input_dir='print_ready', output_dir='print_sheets', cards_per_sheet=8):
+def list_card_files(input_dir, names=None):
     """
-    Create printable sheets with 8 cards each (2 rows x 4 columns, rotated 90°)
-    For 8.5" x 11" paper in landscape orientation
+    PNG files to lay out. By default every PNG in input_dir, sorted by name.
+    With names, only those cards, in the order given (cmd_sheets checks them
+    and puts them in deck order).
     """
+    if names is None:
+        png_files = [f for f in os.listdir(input_dir) if f.endswith('.png')]
+        png_files.sort()  # Sort for consistent ordering
+        return png_files
+    from generate_power_cards import sanitize_filename
+    return [sanitize_filename(name) + '.png' for name in names]
+
+def check_card_sizes(card_paths, profile):
+    """
+    Raise ValueError if any card PNG is not the profile's pixel size, e.g.
+    cards rasterized for another profile or by the old fixed-size script.
+    """
+    from PIL import Image
+    expected = (profile['width_px'], profile['height_px'])
+    wrong = []
+    for card_path in card_paths:
+        with Image.open(card_path) as card:
+            if card.size != expected:
+                wrong.append(f"{os.path.basename(card_path)} is {card.size[0]}x{card.size[1]}")
+    if wrong:
+        raise ValueError(
+            f"{len(wrong)} cards are not {expected[0]}x{expected[1]}px ({profile['name']}): {', '.join(wrong[:5])}"
+            f"{', ...' if len(wrong) > 5 else ''}. Rasterize them with `python mmrpg_cards.py rasterize {profile['name']}`."
+        )
+
+# Cut line color for the sheets with guides
+GUIDE_COLOR = (0xcc, 0xcc, 0xcc)
+
+# Fixed PNG encoder settings so sheets are byte-identical between runs and
+# Pillow defaults; only the DPI (pHYs) chunk is written, no text or time chunks
+PNG_SAVE_OPTIONS = {'compress_level': 6, 'optimize': False}
+
+def save_sheet(sheet, sheet_path, dpi):
+    sheet.save(sheet_path, format='PNG', dpi=(dpi, dpi), **PNG_SAVE_OPTIONS)
+
+def draw_cut_lines(draw, grid, fill='#cccccc'):
+    """
+    Draw the cut guides (light gray, dashed-looking) for a sheet grid.
+    """
+    total_cards_width = grid['cols'] * grid['card_width']
+    total_cards_height = grid['rows'] * grid['card_height']
+    margin_x = grid['margin_x']
+    margin_y = grid['margin_y']
+    
+    # Vertical cut lines
+    for col in range(1, grid['cols']):
+        x = margin_x + col * grid['card_width']
+        draw.line([(x, margin_y), (x, margin_y + total_cards_height)], 
+                 fill=fill, width=2)
+    
+    # Horizontal cut lines  
+    for row in range(1, grid['rows']):
+        y = margin_y + row * grid['card_height']
+        draw.line([(margin_x, y), (margin_x + total_cards_width, y)], 
+                 fill=fill, width=2)
+    
+    # Outer border
+    draw.rectangle([(margin_x, margin_y), 
+                   (margin_x + total_cards_width, margin_y + total_cards_height)], 
+                  outline=fill, width=2)
+
+def pil_compositor(grid, guides=False):
+    """
+    Return compose(card_paths), which pastes up to one sheet's worth of cards
+    onto a fresh white sheet and returns it as a PIL image.
+    """
+    from PIL import Image, ImageDraw
     
-    # Sheet dimensions for 8.5x11" at 300 DPI
-    SHEET_WIDTH = int(11 * 300)   # 3300px (landscape)
-    SHEET_HEIGHT = int(8.5 * 300) # 2550px
-    
-    # Card dimensions (keep original: 2.25" x 3.5")
-    CARD_WIDTH = 675    # Original width
-    CARD_HEIGHT = 1050  # Original height
-    
-    # Layout: 4 cards wide, 2 cards tall
-    COLS = 4
-    ROWS = 2
-    
-    # Calculate spacing to center the grid
-    total_cards_width = COLS * CARD_WIDTH
-    total_cards_height = ROWS * CARD_HEIGHT
-    margin_x = (SHEET_WIDTH - total_cards_width) // 2
-    margin_y = (SHEET_HEIGHT - total_cards_height) // 2
-    
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Get all PNG files
-    png_files = [f for f in os.listdir(input_dir) if f.endswith('.png')]
-    png_files.sort()  # Sort for consistent ordering
-    
-    total_sheets = math.ceil(len(png_files) / cards_per_sheet)
-    
-    for sheet_num in range(total_sheets):
+    def compose(card_paths):
         # Create blank sheet (white background)
-        sheet = Image.new('RGB', (SHEET_WIDTH, SHEET_HEIGHT), 'white')
+        sheet = Image.new('RGB', (grid['sheet_width'], grid['sheet_height']), 'white')
         
         # Add cards to this sheet
-        for i in range(cards_per_sheet):
-            card_index = sheet_num * cards_per_sheet + i
-            
-            if card_index >= len(png_files):
-                break  # No more cards
-                
+        for i, card_path in enumerate(card_paths):
             # Load card (no rotation needed)
-            card_path = os.path.join(input_dir, png_files[card_index])
             card = Image.open(card_path)
             
             # Calculate position on sheet
-            col = i % COLS
-            row = i // COLS
+            col = i % grid['cols']
+            row = i // grid['cols']
             
-            x = margin_x + col * CARD_WIDTH
-            y = margin_y + row * CARD_HEIGHT
+            x = grid['margin_x'] + col * grid['card_width']
+            y = grid['margin_y'] + row * grid['card_height']
             
             # Paste card onto sheet
             sheet.paste(card, (x, y))
         
+        if guides:
+            draw_cut_lines(ImageDraw.Draw(sheet), grid)
+        return sheet
+    
+    return compose
+
+def numpy_compositor(grid, guides=False):
+    """
+    Like pil_compositor, but every sheet is composited into one preallocated
+    NumPy buffer. Cards are written into their grid slot with slice assignment
+    and the guides are stamped from pixel indices computed once. Output pixels
+    match the PIL backend for cards of the profile size; larger cards are
+    clipped to their slot. The returned image is reused by the next call, so
+    save it first.
+
+    The buffer is RGBX, the layout PIL keeps RGB images in, so cards copy in
+    as whole 4-byte pixels and each sheet is unpacked into the reused image
+    with one copy. That copy is not avoided: wrapping the buffer with
+    Image.frombuffer gives an RGBX image, which the PNG writer does not
+    accept, and converting it to RGB costs more than the copy.
+    """
+    import numpy as np
+    from PIL import Image, ImageDraw
+    
+    size = (grid['sheet_width'], grid['sheet_height'])
+    card_width = grid['card_width']
+    card_height = grid['card_height']
+    buffer = np.full((size[1], size[0], 4), 255, dtype=np.uint8)
+    pixels = buffer.reshape(-1, 4)
+    sheet = Image.new('RGB', size)
+    slots = []
+    for i in range(grid['cols'] * grid['rows']):
+        x = grid['margin_x'] + (i % grid['cols']) * card_width
+        y = grid['margin_y'] + (i // grid['cols']) * card_height
+        slots.append(buffer[y:y + card_height, x:x + card_width])
+    
+    guide_pixels = None
+    if guides:
+        # Same drawing calls as the PIL backend, so the stamped pixels match
+        mask = Image.new('L', size, 0)
+        draw_cut_lines(ImageDraw.Draw(mask), grid, fill=255)
+        guide_pixels = np.flatnonzero(np.asarray(mask))
+    
+    def compose(card_paths):
+        for slot, card_path in zip(slots, card_paths):
+            with Image.open(card_path) as card:
+                if card.mode != 'RGB':
+                    card = card.convert('RGB')
+                card_pixels = np.frombuffer(card.tobytes('raw', 'RGBX'), dtype=np.uint8).reshape(card.height, card.width, 4)
+            height = min(card_height, card_pixels.shape[0])
+            width = min(card_width, card_pixels.shape[1])
+            if (height, width) != slot.shape[:2]:
+                slot[:] = 255
+            slot[:height, :width] = card_pixels[:height, :width]
+        # Blank slots left over from the previous sheet
+        for slot in slots[len(card_paths):]:
+            slot[:] = 255
+        if guide_pixels is not None:
+            pixels[guide_pixels, :3] = GUIDE_COLOR
+        # Unpack into the reused image in place rather than allocating a new
+        # sheet-sized image per sheet
+        sheet.frombytes(buffer, 'raw', 'RGBX')
+        return sheet
+    
+    return compose
+
+SHEET_BACKENDS = {
+    'pil': pil_compositor,
+    'numpy': numpy_compositor,
+}
+
+def create_card_sheets(input_dir='print_ready', output_dir='print_sheets', profile=DEFAULT_PROFILE, names=None, backend='pil'):
+    """
+    Create printable sheets for 8.5" x 11" paper in landscape orientation
+    Card size and DPI come from the named card profile, and the grid (columns,
+    rows and cards per sheet) from sheet_grid(profile). backend picks the
+    compositor ('pil' or 'numpy', see SHEET_BACKENDS). Raises ValueError,
+    before writing anything, if a card PNG is not the profile's size.
+    """
+    profile = get_profile(profile)
+    grid = sheet_grid(profile)
+    
+    # Layout: as many columns and rows as fit (4x2 for bridge_300)
+    cards_per_sheet = grid['cards_per_sheet']
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Get all PNG files (or just the named cards)
+    png_files = list_card_files(input_dir, names)
+    card_paths = [os.path.join(input_dir, f) for f in png_files]
+    check_card_sizes(card_paths, profile)
+    
+    total_sheets = math.ceil(len(png_files) / cards_per_sheet)
+    
+    compose = SHEET_BACKENDS[backend](grid)
+    for sheet_num in range(total_sheets):
+        start = sheet_num * cards_per_sheet
+        sheet = compose(card_paths[start:start + cards_per_sheet])
+        
         # Save sheet
         sheet_filename = f'sheet_{sheet_num + 1:03d}.png'
         sheet_path = os.path.join(output_dir, sheet_filename)
-        sheet.save(sheet_path, dpi=(300, 300))
+        save_sheet(sheet, sheet_path, profile['dpi'])
         
         print(f"Created {sheet_filename} with {min(cards_per_sheet, len(png_files) - sheet_num * cards_per_sheet)} cards")
     
@@ -70,83 +206,43 @@ def create_card_sheets(input_dir='print_ready', output_dir='print_sheets', cards
     print(f"📁 Saved to '{output_dir}' directory")
     print(f"📄 Each sheet fits on 8.5\"x11\" paper (landscape)")
 
-def create_sheets_with_cut_lines(input_dir='print_ready', output_dir='print_sheets_with_guides'):
+def create_sheets_with_cut_lines(input_dir='print_ready', output_dir='print_sheets_with_guides', profile=DEFAULT_PROFILE, names=None, backend='pil'):
     """
     Same as above but adds cut lines for easier trimming
     """
-    from PIL import ImageDraw
-    
     # Same dimensions as above
-    SHEET_WIDTH = int(11 * 300)
-    SHEET_HEIGHT = int(8.5 * 300)
-    CARD_WIDTH = 675    # Keep original dimensions
-    CARD_HEIGHT = 1050
-    COLS = 4
-    ROWS = 2
-    
-    total_cards_width = COLS * CARD_WIDTH
-    total_cards_height = ROWS * CARD_HEIGHT
-    margin_x = (SHEET_WIDTH - total_cards_width) // 2
-    margin_y = (SHEET_HEIGHT - total_cards_height) // 2
+    profile = get_profile(profile)
+    grid = sheet_grid(profile)
+    cards_per_sheet = grid['cards_per_sheet']
     
     os.makedirs(output_dir, exist_ok=True)
     
-    png_files = [f for f in os.listdir(input_dir) if f.endswith('.png')]
-    png_files.sort()
+    png_files = list_card_files(input_dir, names)
+    card_paths = [os.path.join(input_dir, f) for f in png_files]
+    check_card_sizes(card_paths, profile)
     
-    total_sheets = math.ceil(len(png_files) / 8)
+    total_sheets = math.ceil(len(png_files) / cards_per_sheet)
     
+    compose = SHEET_BACKENDS[backend](grid, guides=True)
     for sheet_num in range(total_sheets):
-        sheet = Image.new('RGB', (SHEET_WIDTH, SHEET_HEIGHT), 'white')
-        draw = ImageDraw.Draw(sheet)
-        
-        # Add cards
-        for i in range(8):
-            card_index = sheet_num * 8 + i
-            if card_index >= len(png_files):
-                break
-                
-            card_path = os.path.join(input_dir, png_files[card_index])
-            card = Image.open(card_path)
-            
-            col = i % COLS
-            row = i // COLS
-            x = margin_x + col * CARD_WIDTH
-            y = margin_y + row * CARD_HEIGHT
-            
-            sheet.paste(card, (x, y))
-        
-        # Add cut lines (light gray, dashed-looking)
-        line_color = '#cccccc'
-        
-        # Vertical cut lines
-        for col in range(1, COLS):
-            x = margin_x + col * CARD_WIDTH
-            draw.line([(x, margin_y), (x, margin_y + total_cards_height)], 
-                     fill=line_color, width=2)
-        
-        # Horizontal cut lines  
-        for row in range(1, ROWS):
-            y = margin_y + row * CARD_HEIGHT
-            draw.line([(margin_x, y), (margin_x + total_cards_width, y)], 
-                     fill=line_color, width=2)
-        
-        # Outer border
-        draw.rectangle([(margin_x, margin_y), 
-                       (margin_x + total_cards_width, margin_y + total_cards_height)], 
-                      outline=line_color, width=2)
+        start = sheet_num * cards_per_sheet
+        sheet = compose(card_paths[start:start + cards_per_sheet])
         
         sheet_filename = f'sheet_{sheet_num + 1:03d}_with_guides.png'
         sheet_path = os.path.join(output_dir, sheet_filename)
-        sheet.save(sheet_path, dpi=(300, 300))
+        save_sheet(sheet, sheet_path, profile['dpi'])
         
         print(f"Created {sheet_filename}")
     
     print(f"\n✅ Generated {total_sheets} print sheets with cut guides")
 
+def main(argv=None):
+    # Same options as `mmrpg_cards.py sheets`
+    import argparse
+    from mmrpg_cards import add_sheets_options, cmd_sheets
+    parser = argparse.ArgumentParser(description='Lay out card PNGs on printable sheets, with and without cut guides.')
+    add_sheets_options(parser)
+    return cmd_sheets(parser.parse_args(argv))
+
 if __name__ == '__main__':
-    # Create basic sheets
-    create_card_sheets()
-    
-    # Also create sheets with cut lines
-    create_sheets_with_cut_lines()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,227 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from contextlib import contextmanager
+
+# Compact on-disk deck: a fixed header, an offset table, a name-sorted
+# permutation for lookups by name, then the names and the JSON records.
+#
+#   header   MAGIC, count                              (<8sI)
+#   entries  record_offset, record_len, name_offset, name_len per power (<QIQI)
+#   by_name  entry index per power, sorted by UTF-8 name (<I)
+#   names    UTF-8 power names
+#   records  compact JSON, one object per power
+#
+# All offsets are absolute, so a reader only touches the bytes of the powers
+# it asks for.
+MAGIC = b'MMRPGDK1'
+DECK_SUFFIX = '.deck'
+HEADER = struct.Struct('<8sI')
+ENTRY = struct.Struct('<QIQI')
+SORTED = struct.Struct('<I')
+
+
+def build_deck_index(json_path='marvel_powers.json', deck_path=None):
+    """
+    Convert a powers JSON file into the compact deck format. Returns the path
+    of the written deck file.
+    """
+    if deck_path is None:
+        deck_path = os.path.splitext(json_path)[0] + DECK_SUFFIX
+    with open(json_path, encoding='utf-8') as f:
+        powers = json.load(f)
+
+    names = [power.get('power', '').encode('utf-8') for power in powers]
+    records = [json.dumps(power, ensure_ascii=False, separators=(',', ':')).encode('utf-8') for power in powers]
+    count = len(powers)
+
+    offset = HEADER.size + count * (ENTRY.size + SORTED.size)
+    name_offsets = []
+    for name in names:
+        name_offsets.append(offset)
+        offset += len(name)
+    record_offsets = []
+    for record in records:
+        record_offsets.append(offset)
+        offset += len(record)
+
+    with open(deck_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, count))
+        for i in range(count):
+            f.write(ENTRY.pack(record_offsets[i], len(records[i]), name_offsets[i], len(names[i])))
+        for i in sorted(range(count), key=names.__getitem__):
+            f.write(SORTED.pack(i))
+        f.writelines(names)
+        f.writelines(records)
+    return deck_path
+
+
+class DeckIndex:
+    """
+    Read-only, memory-mapped view of a deck file. Powers are decoded only
+    when accessed, by position (deck[3]) or by name (deck['Accuracy 1']).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mm = None
+        try:
+            # mmap itself raises ValueError for an empty file
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._mm) < HEADER.size:
+                raise ValueError
+            magic, self._count = HEADER.unpack_from(self._mm, 0)
+            # The entry and sorted tables must fit before anything is read
+            if magic != MAGIC or len(self._mm) < HEADER.size + self._count * (ENTRY.size + SORTED.size):
+                raise ValueError
+        except ValueError:
+            self.close()
+            raise ValueError(f"'{path}' is not a deck file") from None
+        self._sorted_offset = HEADER.size + self._count * ENTRY.size
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = self.index_of(key)
+        if key < 0:
+            key += self._count
+        if not 0 <= key < self._count:
+            raise IndexError('deck index out of range')
+        record_offset, record_len, _, _ = self._entry(key)
+        return json.loads(self._mm[record_offset:record_offset + record_len])
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def __contains__(self, name):
+        return self.find(name) != -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _entry(self, i):
+        return ENTRY.unpack_from(self._mm, HEADER.size + i * ENTRY.size)
+
+    def _name_bytes(self, i):
+        _, _, name_offset, name_len = self._entry(i)
+        return self._mm[name_offset:name_offset + name_len]
+
+    def name(self, i):
+        """
+        Power name at position i, without decoding its record.
+        """
+        return self._name_bytes(i).decode('utf-8')
+
+    def names(self):
+        for i in range(self._count):
+            yield self.name(i)
+
+    def find(self, name):
+        """
+        Position of the power with this exact name, or -1. Binary search over
+        the name-sorted table.
+        """
+        target = name.encode('utf-8')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (i,) = SORTED.unpack_from(self._mm, self._sorted_offset + mid * SORTED.size)
+            current = self._name_bytes(i)
+            if current < target:
+                lo = mid + 1
+            elif current > target:
+                hi = mid
+            else:
+                return i
+        return -1
+
+    def index_of(self, name):
+        i = self.find(name)
+        if i == -1:
+            raise KeyError(name)
+        return i
+
+    def get(self, name, default=None):
+        i = self.find(name)
+        return default if i == -1 else self[i]
+
+    def close(self):
+        if getattr(self, '_mm', None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+
+def open_powers(path='marvel_powers.json'):
+    """
+    Open a powers source for reading: a DeckIndex for .deck files, otherwise
+    the JSON list loaded in full.
+    """
+    if path.endswith(DECK_SUFFIX):
+        return DeckIndex(path)
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+@contextmanager
+def opened_powers(path='marvel_powers.json'):
+    """
+    open_powers() for a with block; a deck file is closed when it ends.
+    """
+    powers = open_powers(path)
+    try:
+        yield powers
+    finally:
+        if isinstance(powers, DeckIndex):
+            powers.close()
+
+
+def select_powers(powers, names):
+    """
+    Pick powers by name, in the order given. Deck files look each name up
+    directly; JSON lists are scanned once. Returns (selected, missing), where
+    missing lists the names that matched no power.
+    """
+    if isinstance(powers, DeckIndex):
+        found = {name: powers.get(name) for name in names}
+    else:
+        by_name = {power.get('power'): power for power in powers}
+        found = {name: by_name.get(name) for name in names}
+    selected = [found[name] for name in names if found[name] is not None]
+    missing = [name for name in names if found[name] is None]
+    return selected, missing
+
+
+def deck_order(powers, names):
+    """
+    Sort power names by their position in the deck (a DeckIndex or a JSON
+    list). Every name must be in the deck; check with select_powers first.
+    """
+    if isinstance(powers, DeckIndex):
+        return sorted(names, key=powers.index_of)
+    position = {}
+    for i, power in enumerate(powers):
+        position.setdefault(power.get('power'), i)
+    return sorted(names, key=position.__getitem__)
+
+
+def print_missing_powers(missing, path):
+    print(f"❌ {len(missing)} power{'s' if len(missing) > 1 else ''} not found in {path}:")
+    for name in missing:
+        print(f"   {name}")
+
+
+if __name__ == '__main__':
+    json_path = sys.argv[1] if len(sys.argv) > 1 else 'marvel_powers.json'
+    deck_path = build_deck_index(json_path)
+    with DeckIndex(deck_path) as deck:
+        print(f"💾 Wrote {len(deck)} powers to {deck_path}")
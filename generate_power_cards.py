@@ -1,10 +1,12 @@
 import json
 import os
 import re
-import svgwrite
-from textwrap import wrap
+import sys
+from functools import lru_cache
+from textwrap import TextWrapper, wrap
 
-# Card size in pixels (2.5in x 3.6in at 300 DPI)
+# Design size in pixels (2.5in x 3.6in at 300 DPI); layout happens at this size
+# and card_profiles scales it to each printed size
 CARD_WIDTH_PX = 750
 CARD_HEIGHT_PX = 1080
 PADDING = 45  # px
@@ -61,6 +63,15 @@ LINE_SPACING = 36
 MIN_LINE_SPACING = 22
 UNDERLINE_SPACING = 8
 
+# The body fit shrinks every font and the line spacing by 1 per step. After
+# FONT_SHRINK_STEPS all fonts are at their minimum; line spacing keeps going
+# until MAX_SHRINK_STEPS but does not change the height estimate.
+FONT_SHRINK_STEPS = max(LABEL_FONT_SIZE - MIN_LABEL_FONT_SIZE, VALUE_FONT_SIZE - MIN_VALUE_FONT_SIZE, DESC_FONT_SIZE - MIN_DESC_FONT_SIZE)
+MAX_SHRINK_STEPS = max(FONT_SHRINK_STEPS, LINE_SPACING - MIN_LINE_SPACING)
+
+# Deck-wide layout records, written next to the SVGs
+LAYOUT_INDEX_FILENAME = 'layout_index.json'
+
 # Estimate chars per line for wrapping (for fallback)
 def estimate_chars_per_line(font_size, width):
     # Arial/Helvetica: ~0.6 * font_size per char for uppercase, ~0.55 for mixed
@@ -74,6 +85,50 @@ def wrap_text_pixel(text, font_size, max_width):
     chars_per_line = estimate_chars_per_line(font_size, max_width)
     return wrap(text, width=chars_per_line)
 
+# Only used to split text into the chunks wrap() breaks lines between
+_CHUNKER = TextWrapper()
+
+@lru_cache(maxsize=64)
+def _text_chunks(text):
+    # The layout fit wraps the same few texts of a card at several font sizes;
+    # split each once. Only the current card's texts need to stay cached.
+    # _split_chunks is private, but it is the exact first step of wrap()
+    # (TextWrapper.wrap is `_wrap_chunks(_split_chunks(text))`), so the chunks
+    # are the ones wrap() lays out. check_golden_hashes.py compares
+    # count_wrapped_lines with len(wrap()) for every deck text at every size
+    # the fit uses, so a change in a future Python shows up there.
+    chunks = _CHUNKER._split_chunks(text)
+    lengths = tuple(len(chunk) for chunk in chunks)
+    return lengths, tuple(not chunk.strip() for chunk in chunks), max(lengths, default=0)
+
+def count_wrapped_lines(text, font_size, max_width):
+    """
+    len(wrap_text_pixel(text, font_size, max_width)), counted from the chunk
+    lengths with wrap()'s greedy rules instead of building the lines.
+    """
+    chars_per_line = estimate_chars_per_line(font_size, max_width)
+    lengths, spaces, longest = _text_chunks(text)
+    if longest > chars_per_line:
+        # wrap() splits words longer than a line; let it
+        return len(wrap(text, width=chars_per_line))
+    count = len(lengths)
+    lines = 0
+    i = 0
+    while i < count:
+        # Whitespace is dropped at the start of every line but the first
+        if lines and spaces[i]:
+            i += 1
+        start = i
+        line_length = 0
+        while i < count and line_length + lengths[i] <= chars_per_line:
+            line_length += lengths[i]
+            i += 1
+        # ...and at the end of every line; whitespace-only lines are dropped
+        end = i - 1 if i > start and spaces[i - 1] else i
+        if end > start:
+            lines += 1
+    return lines
+
 def estimate_card_height(power, desc_font, value_font, label_font, line_spacing):
     y = HEADER_HEIGHT + PADDING
     desc = power.get('description', '')
@@ -111,10 +166,38 @@ def fit_header_font_and_wrap(name, font_size=HEADER_FONT_SIZE, min_font_size=MIN
         font_size -= 2
     return [line1, line2], min_font_size
 
-def draw_card(power, outdir='cards'):
-    os.makedirs(outdir, exist_ok=True)
+def estimate_total_content_height(power, desc_font, value_font, label_font, line_spacing):
+    y = HEADER_HEIGHT + PADDING
+    quote = power.get('quote', '')
+    if quote:
+        quote_lines = count_wrapped_lines(quote, desc_font, BODY_WIDTH)
+        y += quote_lines * (desc_font + 6) + 12
+    present_fields = [f for f in FIELD_ORDER if f in power and power[f]]
+    for field in present_fields:
+        value = str(power[field])
+        value_lines = count_wrapped_lines(value, value_font, BODY_WIDTH - 210)
+        y += label_font + value_lines * (value_font + 3)
+        y += value_font + 14  # spacing after field
+    return y
+
+def shrunk_body_sizes(step):
+    """
+    Body (label, value, desc, line spacing) sizes after step 1pt shrink steps.
+    """
+    return (
+        max(LABEL_FONT_SIZE - step, MIN_LABEL_FONT_SIZE),
+        max(VALUE_FONT_SIZE - step, MIN_VALUE_FONT_SIZE),
+        max(DESC_FONT_SIZE - step, MIN_DESC_FONT_SIZE),
+        max(LINE_SPACING - step, MIN_LINE_SPACING),
+    )
+
+def fit_card_layout(power):
+    """
+    Run the header and body fitting math for a card without building any SVG.
+    Returns a dict with the final font sizes, header wrap decision and whether
+    the content still overflows the footer at the minimum sizes.
+    """
     name = power.get('power', 'Unknown Power')
-    filename = os.path.join(outdir, sanitize_filename(name) + '.svg')
 
     # Fit header (do not change unless requested)
     header_lines, header_font = fit_header_font_and_wrap(name, font_size=HEADER_FONT_SIZE, min_font_size=MIN_HEADER_FONT_SIZE, available_width=HEADER_AVAILABLE_WIDTH, letter_spacing=HEADER_LETTER_SPACING)
@@ -122,50 +205,147 @@ def draw_card(power, outdir='cards'):
     # Calculate max y for content (above footer)
     max_content_y = CARD_HEIGHT_PX - FOOTER_HEIGHT - PADDING
 
-    # Try to fit body content: start with default, reduce if needed
-    label_font = LABEL_FONT_SIZE
-    value_font = VALUE_FONT_SIZE
-    desc_font = DESC_FONT_SIZE
-    line_spacing = LINE_SPACING
-    min_label_font = MIN_LABEL_FONT_SIZE
-    min_value_font = MIN_VALUE_FONT_SIZE
-    min_desc_font = MIN_DESC_FONT_SIZE
-    min_line_spacing = MIN_LINE_SPACING
-    truncated = False
-
-    def estimate_total_content_height(power, desc_font, value_font, label_font, line_spacing):
-        y = HEADER_HEIGHT + PADDING
-        quote = power.get('quote', '')
-        if quote:
-            quote_lines = wrap_text_pixel(quote, desc_font, BODY_WIDTH)
-            y += len(quote_lines) * (desc_font + 6) + 12
-        present_fields = [f for f in FIELD_ORDER if f in power and power[f]]
-        for field in present_fields:
-            value = str(power[field])
-            value_lines = wrap_text_pixel(value, value_font, BODY_WIDTH - 210)
-            y += label_font + len(value_lines) * (value_font + 3)
-            y += value_font + 14  # spacing after field
-        return y
-
-    # Reduce font sizes and spacing until content fits above footer
-    while True:
-        est_height = estimate_total_content_height(power, desc_font, value_font, label_font, line_spacing)
-        if est_height <= max_content_y:
-            break
-        # Reduce font sizes and line spacing
-        if label_font > min_label_font:
-            label_font -= 1
-        if value_font > min_value_font:
-            value_font -= 1
-        if desc_font > min_desc_font:
-            desc_font -= 1
-        if line_spacing > min_line_spacing:
-            line_spacing -= 1
-        # If at minimums and still doesn't fit, stop
-        if (label_font <= min_label_font and value_font <= min_value_font and desc_font <= min_desc_font and line_spacing <= min_line_spacing):
-            break
-
-    dwg = svgwrite.Drawing(filename, size=(CARD_WIDTH_PX, CARD_HEIGHT_PX))
+    heights = {}
+
+    def height_at(step):
+        if step not in heights:
+            label_font, value_font, desc_font, line_spacing = shrunk_body_sizes(step)
+            heights[step] = estimate_total_content_height(power, desc_font, value_font, label_font, line_spacing)
+        return heights[step]
+
+    # Find the first shrink step at which the content fits above the footer.
+    # Smaller fonts never make the estimate taller, so binary-search the step
+    # instead of re-wrapping every field once per point of shrinkage.
+    step = 0
+    if height_at(0) > max_content_y:
+        if height_at(FONT_SHRINK_STEPS) > max_content_y:
+            # Still doesn't fit at minimum sizes; stop there
+            step = MAX_SHRINK_STEPS
+        else:
+            lo, step = 1, FONT_SHRINK_STEPS
+            while lo < step:
+                mid = (lo + step) // 2
+                if height_at(mid) <= max_content_y:
+                    step = mid
+                else:
+                    lo = mid + 1
+    label_font, value_font, desc_font, line_spacing = shrunk_body_sizes(step)
+    est_height = height_at(min(step, FONT_SHRINK_STEPS))
+
+    return {
+        'power': name,
+        'header_lines': header_lines,
+        'header_font': header_font,
+        'label_font': label_font,
+        'value_font': value_font,
+        'desc_font': desc_font,
+        'line_spacing': line_spacing,
+        'est_height': est_height,
+        'max_content_y': max_content_y,
+        'truncated': est_height > max_content_y,
+    }
+
+def layout_card(power):
+    """
+    Build the full layout record for a card: the fit_card_layout() result plus
+    the header, quote and per-field label/value positions that draw_card uses.
+    The record is plain JSON so downstream stages can read it from the layout
+    index instead of parsing the SVG.
+    """
+    layout = fit_card_layout(power)
+    layout['filename'] = sanitize_filename(layout['power']) + '.svg'
+    header_font = layout['header_font']
+    desc_font = layout['desc_font']
+    value_font = layout['value_font']
+    truncated = layout['truncated']
+
+    # Header (centered, with margin, dynamic font and wrapping)
+    if len(layout['header_lines']) == 1:
+        layout['header_ys'] = [HEADER_HEIGHT/2 + 10]
+    else:
+        layout['header_ys'] = [HEADER_HEIGHT/2 - header_font/2 + 10, HEADER_HEIGHT/2 + header_font/2 + 10]
+
+    y = HEADER_HEIGHT + PADDING
+    quote_lines = []
+    quote_ys = []
+    quote = power.get('quote', '')
+    if quote:
+        quote_lines = wrap_text_pixel(quote, desc_font, BODY_WIDTH - 20)
+        if truncated and len(quote_lines) > 3:
+            quote_lines = quote_lines[:3]
+            quote_lines[-1] += '...'
+        for line in quote_lines:
+            quote_ys.append(y)
+            y += desc_font + 6
+        y += 12
+    layout['quote_lines'] = quote_lines
+    layout['quote_ys'] = quote_ys
+
+    # Determine which fields are present, in canonical order
+    present_fields = [f for f in FIELD_ORDER if f in power and power[f]]
+    fields = []
+    for field in present_fields:
+        value_lines = wrap_text_pixel(str(power[field]), value_font, BODY_WIDTH - 210)
+        if truncated and len(value_lines) > 4:
+            value_lines = value_lines[:4]
+            value_lines[-1] += '...'
+        value_ys = []
+        value_y = y
+        for vline in value_lines:
+            value_ys.append(value_y)
+            value_y += value_font + 3
+        value_y -= 3  # last value line baseline
+        fields.append({
+            'field': field,
+            'label': FIELD_LABELS.get(field, field.title()),
+            'label_y': y,
+            'value_lines': value_lines,
+            'value_ys': value_ys,
+        })
+        # Only add spacing between fields, no underlines
+        y = value_y + value_font  # tighter spacing before next field
+    layout['fields'] = fields
+    layout['total_height'] = y
+    return layout
+
+def save_svg(dwg, filename):
+    """
+    Write a drawing with Unix line endings on every platform. svgwrite already
+    sorts attributes and adds no timestamps, so the bytes depend only on the
+    card content.
+    """
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
+        dwg.write(f)
+
+def card_canvas(profile=None):
+    """
+    Canvas size, in design units, of a card drawn for a profile. The design is
+    scaled uniformly to fit the profile's pixel size, and whatever width or
+    height is left over is added to the canvas rather than stretching the
+    artwork. Without a profile, the design size.
+    """
+    if profile is None:
+        return CARD_WIDTH_PX, CARD_HEIGHT_PX
+    scale = min(profile['width_px'] / CARD_WIDTH_PX, profile['height_px'] / CARD_HEIGHT_PX)
+    return round(profile['width_px'] / scale), round(profile['height_px'] / scale)
+
+def build_card_drawing(layout, width=CARD_WIDTH_PX, height=CARD_HEIGHT_PX):
+    """
+    Build the SVG drawing of a laid-out card on a width x height canvas in
+    design units. The header and footer bars span the canvas and the footer
+    sits at its bottom, so extra height becomes body space; extra width is
+    split evenly on both sides of the body.
+    """
+    # Imported here so layout-only runs (--check) don't pay for svgwrite
+    import svgwrite
+
+    header_font = layout['header_font']
+    label_font = layout['label_font']
+    value_font = layout['value_font']
+    desc_font = layout['desc_font']
+    body_x = (width - CARD_WIDTH_PX) // 2
+
+    dwg = svgwrite.Drawing(size=(width, height))
     # Dot pattern background (matches SVG test)
     dot_pattern = dwg.pattern(id="dotPattern", size=(16, 16), patternUnits="userSpaceOnUse")
     dot_pattern.add(dwg.circle(center=(8, 8), r=1.5, fill="#e0e0e0"))
@@ -192,23 +372,23 @@ def draw_card(power, outdir='cards'):
     dwg.defs.add(gloss_grad)
     # Card shadow filter (optional, for web preview)
     # Border
-    dwg.add(dwg.rect(insert=(1, 1), size=(CARD_WIDTH_PX-2, CARD_HEIGHT_PX-2), fill="none", stroke="#ccc", stroke_width=2))
+    dwg.add(dwg.rect(insert=(1, 1), size=(width-2, height-2), fill="none", stroke="#ccc", stroke_width=2))
     # Dot pattern
-    dwg.add(dwg.rect(insert=(0, 0), size=(CARD_WIDTH_PX, CARD_HEIGHT_PX), fill="url(#dotPattern)"))
+    dwg.add(dwg.rect(insert=(0, 0), size=(width, height), fill="url(#dotPattern)"))
     # Linen overlay
-    dwg.add(dwg.rect(insert=(0, 0), size=(CARD_WIDTH_PX, CARD_HEIGHT_PX), fill="url(#linen)", opacity=0.10))
+    dwg.add(dwg.rect(insert=(0, 0), size=(width, height), fill="url(#linen)", opacity=0.10))
     # Header bar (gradient)
-    dwg.add(dwg.rect(insert=(0, 0), size=(CARD_WIDTH_PX, HEADER_HEIGHT), fill="url(#headerGradient)"))
+    dwg.add(dwg.rect(insert=(0, 0), size=(width, HEADER_HEIGHT), fill="url(#headerGradient)"))
     # Footer bar (gradient)
-    dwg.add(dwg.rect(insert=(0, CARD_HEIGHT_PX - FOOTER_HEIGHT), size=(CARD_WIDTH_PX, FOOTER_HEIGHT), fill="url(#footerGradient)"))
+    dwg.add(dwg.rect(insert=(0, height - FOOTER_HEIGHT), size=(width, FOOTER_HEIGHT), fill="url(#footerGradient)"))
     # Header gloss
-    dwg.add(dwg.rect(insert=(0, 0), size=(CARD_WIDTH_PX, 40), fill="url(#headerGloss)"))
+    dwg.add(dwg.rect(insert=(0, 0), size=(width, 40), fill="url(#headerGloss)"))
     # Vertical gray lines flush with card edge
-    dwg.add(dwg.rect(insert=(0, HEADER_HEIGHT), size=(VERT_LINE_WIDTH, CARD_HEIGHT_PX - HEADER_HEIGHT - FOOTER_HEIGHT), fill="#e0e0e0"))
-    dwg.add(dwg.rect(insert=(CARD_WIDTH_PX - VERT_LINE_WIDTH, HEADER_HEIGHT), size=(VERT_LINE_WIDTH, CARD_HEIGHT_PX - HEADER_HEIGHT - FOOTER_HEIGHT), fill="#e0e0e0"))
+    dwg.add(dwg.rect(insert=(0, HEADER_HEIGHT), size=(VERT_LINE_WIDTH, height - HEADER_HEIGHT - FOOTER_HEIGHT), fill="#e0e0e0"))
+    dwg.add(dwg.rect(insert=(width - VERT_LINE_WIDTH, HEADER_HEIGHT), size=(VERT_LINE_WIDTH, height - HEADER_HEIGHT - FOOTER_HEIGHT), fill="#e0e0e0"))
 
     # S.H.I.E.L.D. watermark (centered, no ellipse, subtle)
-    shield_group = dwg.g(transform="translate(375,540) scale(1.71) translate(-175,-174)")
+    shield_group = dwg.g(transform=f"translate({width/2:g},{height/2:g}) scale(1.71) translate(-175,-174)")
     shield_group.add(dwg.path(
         d="M 62 52.21 a 167.2 167.2 0 0 0 -27 32.24 l 140 154.37 L 314.47 84 a 166.25 166.25 0 0 0 -27.54 -32.22 L 211 112.24 l -18.14 -38.43 s 4.46 -13.61 20.25 -6.75 c 0 0 4.12 -15.06 -20.24 -15.06 H 172 s -7.32 -1.17 -13.11 11 l -23.33 48.82 L 61.3 53.53",
         fill="#222", fill_opacity=0.04
@@ -220,10 +400,9 @@ def draw_card(power, outdir='cards'):
     dwg.add(shield_group)
 
     # Header (centered, with margin, dynamic font and wrapping)
-    header_y = HEADER_HEIGHT/2 + 10
-    if len(header_lines) == 1:
-        dwg.add(dwg.text(header_lines[0],
-            insert=(CARD_WIDTH_PX/2, header_y),
+    for line, line_y in zip(layout['header_lines'], layout['header_ys']):
+        dwg.add(dwg.text(line,
+            insert=(width/2, line_y),
             text_anchor='middle',
             alignment_baseline='middle',
             font_size=header_font,
@@ -232,94 +411,40 @@ def draw_card(power, outdir='cards'):
             font_weight='bold',
             letter_spacing=HEADER_LETTER_SPACING,
         ))
-    else:
-        y1 = HEADER_HEIGHT/2 - header_font/2 + 10
-        y2 = HEADER_HEIGHT/2 + header_font/2 + 10
-        dwg.add(dwg.text(header_lines[0],
-            insert=(CARD_WIDTH_PX/2, y1),
-            text_anchor='middle',
-            alignment_baseline='middle',
-            font_size=header_font,
-            font_family=FONT_FAMILY,
-            fill=WHITE,
-            font_weight='bold',
-            letter_spacing=HEADER_LETTER_SPACING,
-        ))
-        dwg.add(dwg.text(header_lines[1],
-            insert=(CARD_WIDTH_PX/2, y2),
+
+    # Render quote (if present) at the top, italicized and centered
+    for line, line_y in zip(layout['quote_lines'], layout['quote_ys']):
+        dwg.add(dwg.text(line,
+            insert=(width/2, line_y),
             text_anchor='middle',
-            alignment_baseline='middle',
-            font_size=header_font,
+            font_size=desc_font,
             font_family=FONT_FAMILY,
-            fill=WHITE,
-            font_weight='bold',
-            letter_spacing=HEADER_LETTER_SPACING,
+            fill=BLACK,
+            font_style='italic',
+            style='font-style:italic;',
         ))
 
-    y = HEADER_HEIGHT + PADDING
-    # Render quote (if present) at the top, italicized and centered
-    quote = power.get('quote', '')
-    if quote:
-        quote_lines = wrap_text_pixel(quote, desc_font, BODY_WIDTH - 20)
-        if truncated and len(quote_lines) > 3:
-            quote_lines = quote_lines[:3]
-            quote_lines[-1] += '...'
-        for line in quote_lines:
-            dwg.add(dwg.text(line,
-                insert=(CARD_WIDTH_PX/2, y),
-                text_anchor='middle',
-                font_size=desc_font,
-                font_family=FONT_FAMILY,
-                fill=BLACK,
-                font_style='italic',
-                style='font-style:italic;',
-            ))
-            y += desc_font + 6
-        y += 12
-
-    # Determine which fields are present, in canonical order
-    present_fields = [f for f in FIELD_ORDER if f in power and power[f]]
-    last_field = present_fields[-1] if present_fields else None
-
-    effect_field_idx = None
-    for idx, field in enumerate(present_fields):
-        if field == 'effect':
-            effect_field_idx = idx
-            break
-
-    underline_fields = {'power_set', 'action', 'duration', 'cost', 'effect'}  # unused now
-    for idx, field in enumerate(present_fields):
-        label = FIELD_LABELS.get(field, field.title())
-        value = str(power[field])
+    for field in layout['fields']:
         # Field label (navy, bold)
-        dwg.add(dwg.text(f'{label}:',
-            insert=(LABEL_X, y),
+        dwg.add(dwg.text(f"{field['label']}:",
+            insert=(LABEL_X + body_x, field['label_y']),
             font_size=label_font,
             font_family=FONT_FAMILY,
             fill="#223355",
             font_weight='bold',
         ))
-        value_lines = wrap_text_pixel(value, value_font, BODY_WIDTH - 210)
-        if truncated and len(value_lines) > 4:
-            value_lines = value_lines[:4]
-            value_lines[-1] += '...'
-        value_y = y
-        for vline in value_lines:
+        for vline, value_y in zip(field['value_lines'], field['value_ys']):
             dwg.add(dwg.text(vline,
-                insert=(VALUE_X, value_y),
+                insert=(VALUE_X + body_x, value_y),
                 font_size=value_font,
                 font_family=FONT_FAMILY,
                 fill="#222",
             ))
-            value_y += value_font + 3
-        value_y -= 3  # last value line baseline
-        # Only add spacing between fields, no underlines
-        y = value_y + value_font  # tighter spacing before next field
 
     # POWER text
-    footer_text_y = CARD_HEIGHT_PX - FOOTER_HEIGHT/2 + 10
+    footer_text_y = height - FOOTER_HEIGHT/2 + 10
     dwg.add(dwg.text('POWER',
-        insert=(CARD_WIDTH_PX/2, footer_text_y),
+        insert=(width/2, footer_text_y),
         text_anchor='middle',
         alignment_baseline='middle',
         font_size=36,
@@ -328,21 +453,128 @@ def draw_card(power, outdir='cards'):
         font_weight='bold',
         letter_spacing=6,
     ))
-    # Red underline under POWER (rounded rect, 200px wide, 6px high, centered at y=1060)
+    # Red underline under POWER (rounded rect, 200px wide, 6px high, 20px above the bottom edge)
     dwg.add(dwg.rect(
-        insert=(CARD_WIDTH_PX/2 - 100, 1060),
+        insert=(width/2 - 100, height - 20),
         size=(200, 6),
         fill="#c00",
         rx=3
     ))
-    dwg.save()
+    return dwg
+
+def draw_card(power, outdir='cards', layout=None, profiles=None):
+    """
+    Render a card to SVG. By default the card is written to outdir at the
+    design size. With profiles, the text is fitted once and the card is saved
+    to outdir/<profile>/ for each profile, drawn on that profile's canvas
+    (see card_canvas) and scaled uniformly to its pixel size.
+    """
+    os.makedirs(outdir, exist_ok=True)
+    if layout is None:
+        layout = layout_card(power)
+    if not profiles:
+        save_svg(build_card_drawing(layout), os.path.join(outdir, layout['filename']))
+        return layout
+    drawings = {}
+    for profile in profiles:
+        canvas = card_canvas(profile)
+        if canvas not in drawings:
+            drawings[canvas] = build_card_drawing(layout, *canvas)
+            drawings[canvas].viewbox(0, 0, *canvas)
+        dwg = drawings[canvas]
+        dwg['width'] = profile['width_px']
+        dwg['height'] = profile['height_px']
+        profile_dir = os.path.join(outdir, profile['name'])
+        os.makedirs(profile_dir, exist_ok=True)
+        save_svg(dwg, os.path.join(profile_dir, layout['filename']))
+    return layout
+
+def write_layout_index(layouts, outdir='cards', merge=False, profile=None):
+    """
+    Write the deck-wide layout index next to the SVGs, keyed by card file stem,
+    so later stages can look a card's layout up without re-parsing its SVG.
+    With merge, records for other cards already in the index are kept. With a
+    profile, the card size and body x positions are those of its canvas.
+    """
+    path = os.path.join(outdir, LAYOUT_INDEX_FILENAME)
+    cards = {}
+    if merge and os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            cards = json.load(f)['cards']
+    cards.update((os.path.splitext(layout['filename'])[0], layout) for layout in layouts)
+    width, height = card_canvas(profile)
+    body_x = (width - CARD_WIDTH_PX) // 2
+    index = {
+        'card_width': width,
+        'card_height': height,
+        'label_x': LABEL_X + body_x,
+        'value_x': VALUE_X + body_x,
+        'cards': cards,
+    }
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(index, f, ensure_ascii=False, sort_keys=True)
+    return path
+
+def check_card_layouts(powers):
+    """
+    Layout-only pass over the whole deck. Returns one fit_card_layout() result
+    per power, in deck order.
+    """
+    return [fit_card_layout(power) for power in powers]
+
+def print_layout_table(layouts):
+    print(f"{'Card':<40} {'Header':<13} {'Label':>5} {'Value':>5} {'Desc':>5} {'Height':>9}  Status")
+    for layout in layouts:
+        lines = len(layout['header_lines'])
+        header = f"{lines} line{'s' if lines > 1 else ''} @ {layout['header_font']}"
+        height = f"{layout['est_height']}/{layout['max_content_y']}"
+        if layout['truncated']:
+            status = 'OVERFLOW'
+        elif layout['desc_font'] < DESC_FONT_SIZE:
+            status = 'shrunk'
+        else:
+            status = 'ok'
+        print(f"{layout['power'][:40]:<40} {header:<13} {layout['label_font']:>5} {layout['value_font']:>5} {layout['desc_font']:>5} {height:>9}  {status}")
+
+def check_deck(powers):
+    """
+    Print the layout table for the deck; returns 1 if any card overflows.
+    """
+    layouts = check_card_layouts(powers)
+    print_layout_table(layouts)
+    overflowing = [layout['power'] for layout in layouts if layout['truncated']]
+    if overflowing:
+        print(f"\n❌ {len(overflowing)} of {len(layouts)} cards overflow the footer at minimum font sizes:")
+        for name in overflowing:
+            print(f"   {name}")
+        return 1
+    print(f"\n✅ All {len(layouts)} cards fit.")
+    return 0
+
+def render_deck(powers, profiles=None, merge=False):
+    """
+    Render every power to SVG (per profile if given) and write the layout
+    index. With merge, existing index records for other cards are kept.
+    """
+    layouts = [draw_card(power, profiles=profiles) for power in powers]
+    if not profiles:
+        write_layout_index(layouts, merge=merge)
+        print(f"✅ Generated {len(layouts)} SVG cards in the 'cards/' directory.")
+        return 0
+    for profile in profiles:
+        write_layout_index(layouts, os.path.join('cards', profile['name']), merge=merge, profile=profile)
+    print(f"✅ Generated {len(layouts)} SVG cards for {len(profiles)} profiles ({', '.join(p['name'] for p in profiles)}) under 'cards/'.")
+    return 0
 
-def main():
-    with open('marvel_powers.json', encoding='utf-8') as f:
-        powers = json.load(f)
-    for power in powers:
-        draw_card(power)
-    print(f"✅ Generated {len(powers)} SVG cards in the 'cards/' directory.")
+def main(argv=None):
+    # Same options as `mmrpg_cards.py render`, plus --check for `mmrpg_cards.py check`
+    import argparse
+    from mmrpg_cards import add_render_options, cmd_check, cmd_render
+    parser = argparse.ArgumentParser(description='Render power cards to SVG.')
+    add_render_options(parser)
+    parser.add_argument('--check', action='store_true', help='only run the layout check; exit 1 if any card overflows')
+    args = parser.parse_args(argv)
+    return cmd_check(args) if args.check else cmd_render(args)
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    sys.exit(main())
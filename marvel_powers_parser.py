@@ -1,6 +1,5 @@
 import re
 import json
-from bs4 import BeautifulSoup
 import quopri
 
 def decode_mhtml_file(filename='marvel_powers.html'):
@@ -56,6 +55,9 @@ def parse_marvel_powers(filename='marvel_powers.html'):
     """
     Parse Marvel powers from the HTML file and return structured data.
     """
+    # Imported here so --txt runs don't pay for BeautifulSoup
+    from bs4 import BeautifulSoup
+    
     # Decode the file first
     html_content = decode_mhtml_file(filename)
     if not html_content:
@@ -236,9 +238,10 @@ def parse_marvel_powers_txt(filename='marvel_powers.txt'):
         parsed_powers.append(power)
     return parsed_powers
 
-if __name__ == "__main__":
+def main(argv=None):
     import sys
-    if len(sys.argv) > 1 and sys.argv[1] == '--txt':
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == '--txt':
         print("🚀 Starting Marvel Powers TXT Parser...")
         powers = parse_marvel_powers_txt()
         if powers:
@@ -246,6 +249,7 @@ if __name__ == "__main__":
             save_powers_to_json(powers, 'marvel_powers.json')
         else:
             print("❌ No powers found!")
+            return 1
     else:
         print("🚀 Starting Marvel Powers Parser...")
         powers = parse_marvel_powers()
@@ -254,4 +258,10 @@ if __name__ == "__main__":
             print_power_summary(powers)
             save_powers_to_json(powers)
         else:
-            print("❌ No powers found!") 
\ No newline at end of file
+            print("❌ No powers found!")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main()) 
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+Single entry point for the card pipeline:
+
+    python mmrpg_cards.py parse [--txt]
+    python mmrpg_cards.py render [--powers FILE] [--only NAMES] [--profiles LIST]
+    python mmrpg_cards.py rasterize [PROFILE] [--cards-dir DIR] [--output-dir DIR] [--workers N]
+    python mmrpg_cards.py sheets [PROFILE] [--powers FILE] [--only NAMES] [--no-guides] [--backend pil|numpy]
+    python mmrpg_cards.py check [--powers FILE] [--only NAMES]
+    python mmrpg_cards.py deck [JSON]
+    python mmrpg_cards.py build [--powers FILE] [--profile NAME] [--backend pil|numpy] [--workers N] [--no-guides]
+
+Only argparse and the card profile table are imported up front. Each
+subcommand imports the module it needs (and through it svgwrite, PIL or
+BeautifulSoup) when it runs, so help and layout checks stay fast.
+
+The standalone scripts (generate_power_cards.py, create_printable_sheets.py,
+pipeline.py) build their parsers from the add_*_options helpers below and run
+the matching cmd_* function, so both ways of running a step take the same
+options.
+"""
+import argparse
+import sys
+from card_profiles import DEFAULT_PROFILE, PROFILES, parse_profiles
+
+
+def _run_on_powers(args, run):
+    """
+    Call run(powers) with the powers from --powers, limited to --only. Returns
+    1 without calling it if an --only name is not in the deck.
+    """
+    from deck_index import opened_powers, print_missing_powers, select_powers
+    with opened_powers(args.powers) as powers:
+        if args.only:
+            powers, missing = select_powers(powers, args.only.split(','))
+            if missing:
+                print_missing_powers(missing, args.powers)
+                return 1
+        return run(powers)
+
+
+def cmd_parse(args):
+    import marvel_powers_parser
+    return marvel_powers_parser.main(['--txt'] if args.txt else [])
+
+
+def cmd_render(args):
+    from generate_power_cards import render_deck
+    return _run_on_powers(args, lambda powers: render_deck(powers, args.profiles, merge=bool(args.only)))
+
+
+def _magick_missing():
+    """
+    Print an error and return True if ImageMagick is not on PATH.
+    """
+    import shutil
+    from pipeline import RASTERIZE_COMMAND
+    if shutil.which(RASTERIZE_COMMAND[0]) is None:
+        print(f"❌ '{RASTERIZE_COMMAND[0]}' (ImageMagick) not found on PATH; it is needed to rasterize cards.")
+        return True
+    return False
+
+
+def cmd_rasterize(args):
+    from pipeline import rasterize_cards
+    if _magick_missing():
+        return 1
+    return rasterize_cards(profile=args.profile, cards_dir=args.cards_dir, png_dir=args.output_dir, workers=args.workers)
+
+
+def cmd_sheets(args):
+    from create_printable_sheets import create_card_sheets, create_sheets_with_cut_lines
+    from deck_index import deck_order, opened_powers, print_missing_powers, select_powers
+    names = None
+    if args.only:
+        # Check the names against --powers (JSON or deck) and lay them out in
+        # deck order
+        with opened_powers(args.powers) as powers:
+            _, missing = select_powers(powers, args.only.split(','))
+            if missing:
+                print_missing_powers(missing, args.powers)
+                return 1
+            names = deck_order(powers, args.only.split(','))
+    try:
+        create_card_sheets(input_dir=args.input_dir, profile=args.profile, names=names, backend=args.backend)
+        if not args.no_guides:
+            create_sheets_with_cut_lines(input_dir=args.input_dir, profile=args.profile, names=names, backend=args.backend)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+def cmd_check(args):
+    from generate_power_cards import check_deck
+    return _run_on_powers(args, check_deck)
+
+
+def cmd_deck(args):
+    from deck_index import DeckIndex, build_deck_index
+    deck_path = build_deck_index(args.json)
+    with DeckIndex(deck_path) as deck:
+        print(f"💾 Wrote {len(deck)} powers to {deck_path}")
+    return 0
+
+
+def cmd_build(args):
+    from pipeline import build
+    if _magick_missing():
+        return 1
+    return build(powers_path=args.powers, profile=args.profile, backend=args.backend, workers=args.workers, guides=not args.no_guides)
+
+
+def add_powers_options(parser):
+    parser.add_argument('--powers', default='marvel_powers.json', help='powers JSON or .deck file (default: marvel_powers.json)')
+    parser.add_argument('--only', help='comma-separated power names to limit the run to')
+
+
+def add_render_options(parser):
+    add_powers_options(parser)
+    parser.add_argument('--profiles', type=parse_profiles, help="comma-separated card profiles, or 'all' (default: design size)")
+
+
+def add_rasterize_options(parser):
+    parser.add_argument('profile', nargs='?', default=DEFAULT_PROFILE, choices=list(PROFILES), metavar='PROFILE', help=f"card profile to rasterize: {', '.join(PROFILES)} (default: {DEFAULT_PROFILE})")
+    parser.add_argument('--cards-dir', default='cards', help='directory holding the <profile>/ SVG directories (default: cards)')
+    parser.add_argument('--output-dir', default='print_ready', help='directory for the card PNGs (default: print_ready)')
+    parser.add_argument('--workers', type=int, help='concurrent ImageMagick jobs (default: CPU count)')
+
+
+def add_sheets_options(parser):
+    parser.add_argument('profile', nargs='?', default=DEFAULT_PROFILE, choices=list(PROFILES), metavar='PROFILE', help=f"card profile of the PNGs: {', '.join(PROFILES)} (default: {DEFAULT_PROFILE})")
+    add_powers_options(parser)
+    parser.add_argument('--input-dir', default='print_ready', help='directory of card PNGs (default: print_ready)')
+    parser.add_argument('--no-guides', action='store_true', help='skip the sheets with cut lines')
+    parser.add_argument('--backend', choices=('pil', 'numpy'), default='pil', help='sheet compositor (default: pil)')
+
+
+def add_build_options(parser):
+    parser.add_argument('--powers', default='marvel_powers.json', help='powers JSON, .deck or .txt file (default: marvel_powers.json)')
+    parser.add_argument('--profile', default=DEFAULT_PROFILE, choices=list(PROFILES), metavar='NAME', help=f"card profile to rasterize to: {', '.join(PROFILES)} (default: {DEFAULT_PROFILE})")
+    parser.add_argument('--backend', choices=('pil', 'numpy'), default='pil', help='sheet compositor (default: pil)')
+    parser.add_argument('--workers', type=int, help='render processes and rasterize jobs (default: CPU count)')
+    parser.add_argument('--no-guides', action='store_true', help='skip the sheets with cut lines')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='mmrpg-cards', description='Marvel Multiverse RPG power card pipeline.')
+    subparsers = parser.add_subparsers(dest='command', metavar='{parse,render,rasterize,sheets,check,deck,build}')
+
+    sub = subparsers.add_parser('parse', help='parse marvel_powers.html (or .txt) into marvel_powers.json')
+    sub.add_argument('--txt', action='store_true', help='parse marvel_powers.txt instead of the HTML export')
+    sub.set_defaults(func=cmd_parse)
+
+    sub = subparsers.add_parser('render', help='render SVG cards into cards/')
+    add_render_options(sub)
+    sub.set_defaults(func=cmd_render)
+
+    sub = subparsers.add_parser('rasterize', help='rasterize cards/<profile>/ SVGs into print_ready/ with ImageMagick')
+    add_rasterize_options(sub)
+    sub.set_defaults(func=cmd_rasterize)
+
+    sub = subparsers.add_parser('sheets', help='lay out rasterized cards on printable sheets')
+    add_sheets_options(sub)
+    sub.set_defaults(func=cmd_sheets)
+
+    sub = subparsers.add_parser('check', help='layout-only check for cards that overflow, no SVG output')
+    add_powers_options(sub)
+    sub.set_defaults(func=cmd_check)
+
+    sub = subparsers.add_parser('deck', help='build a memory-mapped .deck file from a powers JSON')
+    sub.add_argument('json', nargs='?', default='marvel_powers.json', help='powers JSON (default: marvel_powers.json)')
+    sub.set_defaults(func=cmd_deck)
+
+    sub = subparsers.add_parser('build', help='run render, rasterize and sheets as one overlapped pipeline')
+    add_build_options(sub)
+    sub.set_defaults(func=cmd_build)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 0
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""
+Pipelined build: parse -> render SVGs -> rasterize PNGs -> write print sheets.
+
+Instead of finishing each stage before the next starts, every stage runs at
+once, connected by bounded queues. SVG rendering (CPU-bound) runs in a process
+pool, ImageMagick rasterizing runs as concurrent subprocesses, and the sheet
+writer saves each sheet as soon as its cards are rasterized. Cards are fed in
+sheet order so the first sheets complete first.
+
+Outputs match the staged build: cards/<profile>/ (plus layout_index.json),
+print_ready/, print_sheets/ and print_sheets_with_guides/.
+
+    python pipeline.py [--powers FILE] [--profile NAME] [--backend pil|numpy]
+                       [--workers N] [--no-guides]
+"""
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+
+from card_profiles import DEFAULT_PROFILE, get_profile, sheet_grid
+
+# ImageMagick conversion of one card, sized per profile; also used by the
+# staged rasterize step (rasterize_cards). The SVGs are drawn at the profile's aspect ratio, so the resize does not
+# need to force (and distort) the size
+RASTERIZE_COMMAND = [
+    'magick', '{svg}', '-density', '{dpi}', '-resize', '{width}x{height}',
+    '-set', 'density', '{dpi}', '-set', 'units', 'PixelsPerInch', '{png}',
+]
+
+STAGES = ('parse', 'render', 'rasterize', 'sheets')
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+
+class Progress:
+    """
+    Thread-safe per-stage counters and timings, printed as one status line.
+    """
+
+    def __init__(self, totals):
+        self.totals = dict(totals)
+        self.done = {stage: 0 for stage in STAGES}
+        self.started = {}
+        self.finished = {}
+        self.start_time = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def start(self, stage):
+        with self._lock:
+            self.started.setdefault(stage, time.perf_counter())
+
+    def advance(self, stage, count=1):
+        with self._lock:
+            self.done[stage] += count
+            self.finished[stage] = time.perf_counter()
+
+    def status(self):
+        with self._lock:
+            return ' | '.join(f"{stage} {self.done[stage]}/{self.totals.get(stage, '?')}" for stage in STAGES)
+
+    def report(self, message=''):
+        print(f"[{time.perf_counter() - self.start_time:6.1f}s] {self.status()}  {message}".rstrip())
+
+    def summary(self):
+        total = time.perf_counter() - self.start_time
+        print(f"\n⏱️  Stage busy spans (wall {total:.1f}s):")
+        for stage in STAGES:
+            if stage in self.started and stage in self.finished:
+                print(f"   {stage:<10} {self.finished[stage] - self.started[stage]:6.1f}s")
+
+
+def render_card(power, outdir, profile):
+    """
+    Process-pool task: render one card SVG for the profile, into
+    outdir/<profile>/, and return its layout record.
+    """
+    from generate_power_cards import draw_card
+    return draw_card(power, outdir=outdir, profiles=[profile])
+
+
+def rasterize_card(svg_path, png_path, profile, command=RASTERIZE_COMMAND):
+    """
+    Rasterize one SVG to a PNG at the profile's pixel size with ImageMagick.
+    """
+    fields = {
+        'svg': svg_path, 'png': png_path, 'dpi': profile['dpi'],
+        'width': profile['width_px'], 'height': profile['height_px'],
+    }
+    result = subprocess.run([arg.format(**fields) for arg in command], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{os.path.basename(svg_path)}: {result.stderr.strip() or f'{command[0]} exited with {result.returncode}'}")
+    return png_path
+
+
+def rasterize_cards(profile=DEFAULT_PROFILE, cards_dir='cards', png_dir='print_ready', workers=None,
+                    rasterize_command=RASTERIZE_COMMAND):
+    """
+    Staged rasterize step: convert every SVG in cards_dir/<profile>/ to a PNG
+    in png_dir at the profile's pixel size, running up to workers ImageMagick
+    processes at once. Returns 0 on success, 1 if any card failed.
+    """
+    from create_printable_sheets import check_card_sizes
+    profile = get_profile(profile)
+    svg_dir = os.path.join(cards_dir, profile['name'])
+    if not os.path.isdir(svg_dir):
+        print(f"❌ No '{svg_dir}' directory; render the cards with --profiles {profile['name']} first.")
+        return 1
+    stems = sorted(os.path.splitext(f)[0] for f in os.listdir(svg_dir) if f.endswith('.svg'))
+    os.makedirs(png_dir, exist_ok=True)
+
+    def rasterize(stem):
+        png_path = rasterize_card(os.path.join(svg_dir, stem + '.svg'), os.path.join(png_dir, stem + '.png'), profile, rasterize_command)
+        check_card_sizes([png_path], profile)
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        for future in [pool.submit(rasterize, stem) for stem in stems]:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(str(e))
+    if errors:
+        print(f"❌ {len(errors)} of {len(stems)} cards failed to rasterize:")
+        for error in errors[:10]:
+            print(f"   {error}")
+        return 1
+    print(f"✅ Rasterized {len(stems)} cards to {profile['width_px']}x{profile['height_px']}px ({profile['name']}) in '{png_dir}'")
+    return 0
+
+
+def _stage(name, inbox, outbox, executor, task, max_pending, progress, errors):
+    """
+    Pull items from inbox, run task(item) on executor with at most
+    max_pending in flight, and push results to outbox as they complete.
+    After a failure the stage keeps draining inbox so upstream never blocks.
+    """
+    pending = set()
+    finished_input = False
+    while not finished_input or pending:
+        while not finished_input and len(pending) < max_pending:
+            try:
+                item = inbox.get(timeout=0.05 if pending else None)
+            except queue.Empty:
+                break
+            if item is _DONE:
+                finished_input = True
+            elif not errors:
+                progress.start(name)
+                pending.add(executor.submit(task, item))
+        if pending:
+            completed, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            for future in completed:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors.append(f'{name}: {e}')
+                    continue
+                progress.advance(name)
+                outbox.put(result)
+    outbox.put(_DONE)
+
+
+def build(powers_path='marvel_powers.json', profile=DEFAULT_PROFILE, backend='pil', workers=None,
+          guides=True, cards_dir='cards', png_dir='print_ready', sheets_dir='print_sheets',
+          guides_dir='print_sheets_with_guides', rasterize_command=RASTERIZE_COMMAND):
+    """
+    Run the whole build as a pipeline. Returns 0 on success, 1 if any stage
+    failed.
+    """
+    from create_printable_sheets import SHEET_BACKENDS, check_card_sizes, save_sheet
+    from generate_power_cards import sanitize_filename, write_layout_index
+
+    profile = get_profile(profile)
+    grid = sheet_grid(profile)
+    cards_per_sheet = grid['cards_per_sheet']
+    workers = workers or os.cpu_count() or 1
+    svg_dir = os.path.join(cards_dir, profile['name'])
+    for directory in (svg_dir, png_dir, sheets_dir) + ((guides_dir,) if guides else ()):
+        os.makedirs(directory, exist_ok=True)
+
+    progress = Progress({'parse': 1})
+    progress.start('parse')
+    if powers_path.endswith('.txt'):
+        from marvel_powers_parser import parse_marvel_powers_txt
+        powers = parse_marvel_powers_txt(powers_path)
+    else:
+        from deck_index import opened_powers
+        with opened_powers(powers_path) as source:
+            powers = list(source)
+    progress.advance('parse')
+
+    # Sheets take cards in PNG filename order, as create_card_sheets does; a
+    # later power with the same filename replaces an earlier one
+    by_filename = {sanitize_filename(power.get('power', 'Unknown Power')) + '.png': power for power in powers}
+    filenames = sorted(by_filename)
+    position = {filename: i for i, filename in enumerate(filenames)}
+    total_sheets = -(-len(filenames) // cards_per_sheet)
+    progress.totals.update(render=len(filenames), rasterize=len(filenames), sheets=total_sheets)
+    progress.report('parsed')
+
+    bound = 2 * workers
+    render_q = queue.Queue(maxsize=bound)
+    raster_q = queue.Queue(maxsize=bound)
+    sheet_q = queue.Queue(maxsize=bound)
+    errors = []
+    layouts = []
+
+    def feed():
+        for filename in filenames:
+            render_q.put(by_filename[filename])
+        render_q.put(_DONE)
+
+    def rasterize(layout):
+        layouts.append(layout)
+        stem = os.path.splitext(layout['filename'])[0]
+        png_path = rasterize_card(os.path.join(svg_dir, layout['filename']), os.path.join(png_dir, stem + '.png'), profile, rasterize_command)
+        check_card_sizes([png_path], profile)
+        return stem + '.png'
+
+    def write_sheets():
+        compose = SHEET_BACKENDS[backend](grid)
+        compose_guides = SHEET_BACKENDS[backend](grid, guides=True) if guides else None
+        remaining = {n: set(filenames[n * cards_per_sheet:(n + 1) * cards_per_sheet]) for n in range(total_sheets)}
+        while True:
+            item = sheet_q.get()
+            if item is _DONE:
+                break
+            sheet_num = position[item] // cards_per_sheet
+            remaining[sheet_num].discard(item)
+            if remaining[sheet_num]:
+                continue
+            progress.start('sheets')
+            card_paths = [os.path.join(png_dir, f) for f in filenames[sheet_num * cards_per_sheet:(sheet_num + 1) * cards_per_sheet]]
+            sheet_filename = f'sheet_{sheet_num + 1:03d}.png'
+            try:
+                save_sheet(compose(card_paths), os.path.join(sheets_dir, sheet_filename), profile['dpi'])
+                if compose_guides is not None:
+                    save_sheet(compose_guides(card_paths), os.path.join(guides_dir, f'sheet_{sheet_num + 1:03d}_with_guides.png'), profile['dpi'])
+            except Exception as e:
+                # Keep draining the queue so the rasterize stage never blocks
+                errors.append(f'sheets: {e}')
+                continue
+            progress.advance('sheets')
+            progress.report(f'wrote {sheet_filename}')
+
+    with ProcessPoolExecutor(max_workers=workers) as render_pool, ThreadPoolExecutor(max_workers=workers) as raster_pool:
+        threads = [
+            threading.Thread(target=feed),
+            threading.Thread(target=_stage, args=('render', render_q, raster_q, render_pool, partial(render_card, outdir=cards_dir, profile=profile), bound, progress, errors)),
+            threading.Thread(target=_stage, args=('rasterize', raster_q, sheet_q, raster_pool, rasterize, bound, progress, errors)),
+            threading.Thread(target=write_sheets),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        print(f"\n❌ Pipeline failed with {len(errors)} errors:")
+        for error in errors[:10]:
+            print(f"   {error}")
+        return 1
+    write_layout_index(sorted(layouts, key=lambda layout: layout['filename']), svg_dir, profile=profile)
+    progress.summary()
+    print(f"\n✅ Built {len(filenames)} cards and {total_sheets} print sheets ({profile['name']})")
+    return 0
+
+
+def main(argv=None):
+    # Same options as `mmrpg_cards.py build`
+    import argparse
+    from mmrpg_cards import add_build_options, cmd_build
+    parser = argparse.ArgumentParser(description='Run render, rasterize and sheets as one overlapped pipeline.')
+    add_build_options(parser)
+    return cmd_build(parser.parse_args(argv))
+
+if __name__ == '__main__':
+    sys.exit(main())